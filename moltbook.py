@@ -18,7 +18,6 @@ Usage:
 import argparse
 import sys
 import os
-import json
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -31,9 +30,6 @@ try:
     from moltbook_client import MoltbookClient
 except ImportError:
     # Fallback for development
-    import requests
-    import json
-
     class MoltbookClient:
         """Minimal Moltbook API client for wrapper integration."""
         
@@ -44,10 +40,28 @@ except ImportError:
             if not self.api_key:
                 raise ValueError("API key required. Set MOLTBOOK_API_KEY env var.")
             self.headers = {"X-API-Key": self.api_key}
+            # Reused across calls so the TCP/TLS connection stays warm
+            # (created on first request - importing requests is slow)
+            self._session = None
+        
+        def _get_session(self):
+            """Keep-alive session with a pooled adapter, created on first use."""
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                
+                session = requests.Session()
+                session.headers.update(self.headers)
+                session.headers["Connection"] = "keep-alive"
+                adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
         
         def _request(self, method: str, endpoint: str, data: dict = None) -> dict:
             url = f"{self.BASE_URL}/{endpoint}"
-            resp = requests.request(method, url, headers=self.headers, json=data)
+            resp = self._get_session().request(method, url, json=data)
             if not resp.ok:
                 raise Exception(f"API Error {resp.status_code}: {resp.text}")
             return resp.json()
@@ -88,8 +102,10 @@ class SafeMoltbookCLI:
         self.api_key = api_key or os.environ.get("MOLTBOOK_API_KEY")
         self.client = MoltbookClient(self.api_key)
         
-        # Initialize PII detector with creator config (in-memory only)
-        self.pii_detector = self._create_detector(creator_config)
+        # PII detector is built on first use (in-memory only), so it is
+        # skipped entirely when protection is disabled
+        self._creator_config = creator_config
+        self._pii_detector = None
         
         # PII protection enabled by default
         self.pii_protection_enabled = True
@@ -98,6 +114,13 @@ class SafeMoltbookCLI:
         self._posts_blocked = 0
         self._posts_allowed = 0
     
+    @property
+    def pii_detector(self) -> PIIDetector:
+        """PII detector for the creator config, created on first access."""
+        if self._pii_detector is None:
+            self._pii_detector = self._create_detector(self._creator_config)
+        return self._pii_detector
+    
     def _create_detector(self, config: dict = None) -> PIIDetector:
         """Create PII detector from config (in-memory only)."""
         if not config:
@@ -129,11 +152,11 @@ class SafeMoltbookCLI:
         if not content:
             return True, "Empty content", None
         
-        has_pii, sanitized = self.pii_detector.check_and_sanitize(content)
+        category, sanitized = self.pii_detector.check_and_sanitize(content)
         
-        if has_pii:
+        if category:
             self._posts_blocked += 1
-            return False, f"PII detected in {field} - post blocked", sanitized
+            return False, f"PII detected in {field} ({category}) - post blocked", sanitized
         
         self._posts_allowed += 1
         return True, f"{field} is safe", None
@@ -262,6 +285,8 @@ NOTE: All posts are checked for PII before being sent.
         parser.print_help()
         sys.exit(1)
     
+    import json
+    
     # Load creator config if provided
     creator_config = None
     if args.creator:
@@ -2,44 +2,156 @@
 PII Detection Module - Safe PII Detection Without Storing PII
 
 This module detects personally identifiable information (PII) without
-storing, logging, or transmitting any PII. It only returns a boolean
-result: True (PII detected) or False (safe to post).
+storing, logging, or transmitting any PII. It only returns the category
+of PII detected (e.g. "email") or None (safe to post).
 
 Design Principles:
 1. PII patterns are stored in-memory during runtime only
 2. No PII is ever written to disk, logs, or network
 3. Detection is performed locally - no external API calls
-4. Returns boolean only - no matched data returned
+4. Returns the category only - no matched data returned
 """
 
+import hashlib
 import re
-from typing import Set, Optional
+from collections import OrderedDict
+from typing import Iterator, List, Set, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    # Optional dependency - fall back to per-keyword substring checks
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    # Optional dependency - fall back to the stdlib backtracking engine
+    re2 = None
 
 # ============================================================================
 # PII PATTERNS - Static, no PII stored
 # ============================================================================
 
-# Common PII patterns (static, no actual PII values)
+# Common PII patterns (static, no actual PII values). Compiled with re.ASCII
+# so \d, \w and \b mean the same under stdlib re and RE2.
 PII_PATTERNS = {
     # Email pattern
-    "email": re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'),
+    "email": re.compile(r'\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}\b', re.ASCII),
     
-    # Phone patterns (US formats)
-    "phone": re.compile(r'(\+?1[-.\s]?)?(\(?\d{3}\)?[-.\s]?)?\d{3}[-.\s]?\d{4}'),
+    # Phone patterns (US formats, area code required)
+    "phone": re.compile(r'(?:\+?\b1[-.\s]?(?:\(\d{3}\)|\d{3})|\(\d{3}\)|\b\d{3})[-.\s]?\d{3}[-.\s]?\d{4}\b', re.ASCII),
     
     # SSN pattern
-    "ssn": re.compile(r'\d{3}-\d{2}-\d{4}'),
+    "ssn": re.compile(r'\b\d{3}-\d{2}-\d{4}\b', re.ASCII),
     
     # Credit card pattern
-    "credit_card": re.compile(r'\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}'),
+    "credit_card": re.compile(r'\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b', re.ASCII),
     
     # IP address pattern
-    "ip_address": re.compile(r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}'),
+    "ip_address": re.compile(r'\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b', re.ASCII),
+    
+    # IPv6 address pattern (full form)
+    "ipv6": re.compile(r'\b(?:[A-Fa-f0-9]{1,4}:){7}[A-Fa-f0-9]{1,4}\b', re.ASCII),
+    
+    # AWS access key ID
+    "aws_key": re.compile(r'\bAKIA[0-9A-Z]{16}\b', re.ASCII),
+    
+    # GitHub tokens (personal, OAuth, user, server, refresh)
+    "github_token": re.compile(r'\bgh[pousr]_[A-Za-z0-9]{36,}\b', re.ASCII),
+    
+    # Generic secret / publishable API keys
+    "generic_key": re.compile(r'\b(?:sk|pk)-[A-Za-z0-9]{20,}\b', re.ASCII),
     
     # Date patterns (potential DOB)
-    "date": re.compile(r'\d{1,2}[-/]\d{1,2}[-/]\d{2,4}'),
+    "date": re.compile(r'\b\d{1,2}[-/]\d{1,2}[-/]\d{2,4}\b', re.ASCII),
 }
 
+# Strips everything but digits (phone normalization)
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+
+
+def _compile_linear(pattern: str):
+    """Compile with RE2 (linear-time DFA) when available, else stdlib re.
+    
+    The stdlib fallback uses re.ASCII to match RE2, whose character classes
+    and word boundaries are ASCII-only, so both engines detect the same text.
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass  # Unsupported syntax - use stdlib re
+    return re.compile(pattern, re.ASCII)
+
+
+# All static patterns fused into one alternation (one named group per
+# category) so a single scan covers every category.
+_COMBINED = _compile_linear(
+    "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in PII_PATTERNS.items())
+)
+
+# Well-known placeholder numbers that are never real phone numbers
+_PHONE_PLACEHOLDERS = frozenset({"1234567890", "5551234567"})
+
+# A whole-word "ISBN"/"part" label, or a "#", right before a digit run marks
+# it as a part/order/ISBN number instead
+_PHONE_PREFIX_RE = re.compile(r'(?:(?<!\w)(?:isbn|part)\b[\s:#-]*|#)$', re.IGNORECASE)
+_PHONE_PREFIX_WINDOW = 8
+
+
+def _is_plausible_phone(match) -> bool:
+    """Validate a phone match against NANP area / central-office rules."""
+    digits = _NON_DIGIT_RE.sub('', match.group())[-10:]
+    area, exchange = digits[:3], digits[3:6]
+    
+    if area[0] not in '23456789' or area[1:] == '11':
+        return False
+    if exchange[0] not in '23456789' or exchange[1:] == '11':
+        return False
+    if digits in _PHONE_PLACEHOLDERS:
+        return False
+    
+    # Lookbehind still sees text before pos, so a label cut off by the
+    # window edge is not mistaken for a whole word
+    start = match.start()
+    prefix = _PHONE_PREFIX_RE.search(
+        match.string, max(0, start - _PHONE_PREFIX_WINDOW), start
+    )
+    return prefix is None
+
+
+def _is_pii_match(match) -> bool:
+    """Check whether a _COMBINED match is PII (phones need validating)."""
+    return match.lastgroup != "phone" or _is_plausible_phone(match)
+
+
+def _is_word_char(char: str) -> bool:
+    """Mirror the regex word-character class for a single character."""
+    return char.isalnum() or char == "_"
+
+
+def _keyword_spans(automaton, text_lower: str) -> Iterator[Tuple[int, int]]:
+    """Yield (start, end) of automaton hits not embedded in a longer word."""
+    for last, keyword in automaton.iter(text_lower):
+        start, end = last - len(keyword) + 1, last + 1
+        if start > 0 and _is_word_char(text_lower[start - 1]):
+            continue
+        if end < len(text_lower) and _is_word_char(text_lower[end]):
+            continue
+        yield start, end
+
+
+# Flags for custom patterns (individually and as one alternation)
+_CUSTOM_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Numbered backreferences and conditional groups shift when patterns are
+# joined into one alternation
+_NUMBERED_BACKREF_RE = re.compile(r'\\[1-9]|\(\?\([1-9]')
+
+# Number of recent contains_pii verdicts kept per detector
+_VERDICT_CACHE_SIZE = 1024
+
 # ============================================================================
 # PII DETECTOR CLASS - Runtime memory only
 # ============================================================================
@@ -60,6 +172,25 @@ class PIIDetector:
     All PII is stored in-memory only and lost when the process ends.
     """
     
+    __slots__ = (
+        "_creator_names",
+        "_creator_handles",
+        "_creator_locations",
+        "_creator_employers",
+        "_creator_family",
+        "_creator_phone",
+        "_creator_email",
+        "_creator_addresses",
+        "_custom_patterns",
+        "_custom_combined",
+        "_custom_dirty",
+        "_ac",
+        "_ac_dirty",
+        "_creator_regex",
+        "_creator_dirty",
+        "_verdict_cache",
+    )
+    
     def __init__(self):
         # In-memory only - never persisted
         self._creator_names: Set[str] = set()
@@ -70,113 +201,203 @@ class PIIDetector:
         self._creator_phone: Set[str] = set()
         self._creator_email: Set[str] = set()
         self._creator_addresses: Set[str] = set()
-        self._custom_patterns: Set[re.Pattern] = set()
+        self._custom_patterns: List[re.Pattern] = []  # Insertion order
+        
+        # Custom patterns fused into one alternation (built lazily)
+        self._custom_combined: Optional[re.Pattern] = None
+        self._custom_dirty = False
+        
+        # Aho-Corasick automaton over all creator keywords (built lazily)
+        self._ac = None
+        self._ac_dirty = False
+        
+        # Same keywords as one regex alternation (used without pyahocorasick)
+        self._creator_regex: Optional[re.Pattern] = None
+        self._creator_dirty = False
+        
+        # Recent verdicts keyed by SHA-256 digest - the text itself is never kept
+        self._verdict_cache: "OrderedDict[bytes, Optional[str]]" = OrderedDict()
+    
+    def _add_keyword(self, bucket: Set[str], keyword: str) -> None:
+        """Track a creator keyword and mark the matchers as stale."""
+        if not keyword:
+            return
+        bucket.add(keyword)
+        self._ac_dirty = True
+        self._creator_dirty = True
+        self._verdict_cache.clear()
+    
+    def _keyword_sets(self) -> Tuple[Set[str], ...]:
+        """All creator keyword sets matched against lowercased text."""
+        return (
+            self._creator_names,
+            self._creator_handles,
+            self._creator_locations,
+            self._creator_employers,
+            self._creator_family,
+            self._creator_email,
+            self._creator_addresses,
+        )
+    
+    def _keyword_automaton(self):
+        """Return the creator keyword automaton, rebuilding it if stale."""
+        if self._ac_dirty:
+            automaton = ahocorasick.Automaton()
+            for bucket in self._keyword_sets():
+                for keyword in bucket:
+                    automaton.add_word(keyword, keyword)
+            if len(automaton):
+                automaton.make_automaton()
+                self._ac = automaton
+            else:
+                self._ac = None
+            self._ac_dirty = False
+        return self._ac
+    
+    def _keyword_regex(self) -> Optional[re.Pattern]:
+        """Return the creator keyword alternation, rebuilding it if stale."""
+        if self._creator_dirty:
+            keywords = sorted(
+                {keyword for bucket in self._keyword_sets() for keyword in bucket},
+                key=len,
+                reverse=True,
+            )
+            if keywords:
+                self._creator_regex = re.compile(
+                    r'(?<!\w)(?:' + '|'.join(map(re.escape, keywords)) + r')(?!\w)',
+                    re.IGNORECASE,
+                )
+            else:
+                self._creator_regex = None
+            self._creator_dirty = False
+        return self._creator_regex
     
     def add_creator_name(self, name: str) -> None:
         """Add creator's name to detection (in-memory only)."""
         # Normalize for detection
         normalized = name.lower().strip()
-        self._creator_names.add(normalized)
+        self._add_keyword(self._creator_names, normalized)
     
     def add_creator_handle(self, handle: str) -> None:
         """Add creator's social handles (in-memory only)."""
         normalized = handle.lower().strip().lstrip('@')
-        self._creator_handles.add(normalized)
+        self._add_keyword(self._creator_handles, normalized)
     
     def add_creator_location(self, location: str) -> None:
         """Add creator's location (in-memory only)."""
         normalized = location.lower().strip()
-        self._creator_locations.add(normalized)
+        self._add_keyword(self._creator_locations, normalized)
     
     def add_creator_employer(self, employer: str) -> None:
         """Add creator's employer (in-memory only)."""
         normalized = employer.lower().strip()
-        self._creator_employers.add(normalized)
+        self._add_keyword(self._creator_employers, normalized)
     
     def add_creator_family(self, name: str) -> None:
         """Add family member names (in-memory only)."""
         normalized = name.lower().strip()
-        self._creator_family.add(normalized)
+        self._add_keyword(self._creator_family, normalized)
     
     def add_creator_phone(self, phone: str) -> None:
         """Add creator's phone number (in-memory only)."""
         # Store normalized version
-        normalized = re.sub(r'[^\d]', '', phone)
+        normalized = _NON_DIGIT_RE.sub('', phone)
+        if not normalized:
+            return
         self._creator_phone.add(normalized)
+        self._verdict_cache.clear()
     
     def add_creator_email(self, email: str) -> None:
         """Add creator's email (in-memory only)."""
         normalized = email.lower().strip()
-        self._creator_email.add(normalized)
+        self._add_keyword(self._creator_email, normalized)
     
     def add_creator_address(self, address: str) -> None:
         """Add creator's address (in-memory only)."""
         normalized = address.lower().strip()
-        self._creator_addresses.add(normalized)
+        self._add_keyword(self._creator_addresses, normalized)
     
     def add_custom_pattern(self, pattern: str) -> None:
         """Add a custom regex pattern (in-memory only)."""
         try:
-            self._custom_patterns.add(re.compile(pattern, re.IGNORECASE))
+            compiled = re.compile(pattern, _CUSTOM_FLAGS)
         except re.error:
-            pass  # Invalid pattern - ignore
+            return  # Invalid pattern - ignore
+        if compiled in self._custom_patterns:
+            return
+        self._custom_patterns.append(compiled)
+        self._custom_dirty = True
+        self._verdict_cache.clear()
     
-    def _check_patterns(self, text: str) -> bool:
-        """Check text against static PII patterns."""
-        for name, pattern in PII_PATTERNS.items():
-            if pattern.search(text):
-                return True
-        return False
+    def _custom_regex(self) -> Optional[re.Pattern]:
+        """Return all custom patterns as one alternation, if they can be fused."""
+        if self._custom_dirty:
+            self._custom_combined = None
+            # Longest first (stable) so the broader of two overlapping
+            # patterns wins, independent of hash seed
+            patterns = sorted(
+                (pattern.pattern for pattern in self._custom_patterns),
+                key=len,
+                reverse=True,
+            )
+            if not any(_NUMBERED_BACKREF_RE.search(pattern) for pattern in patterns):
+                try:
+                    self._custom_combined = re.compile(
+                        "|".join(f"(?:{pattern})" for pattern in patterns),
+                        _CUSTOM_FLAGS,
+                    )
+                except re.error:
+                    pass  # e.g. duplicate group names - search one by one
+            self._custom_dirty = False
+        return self._custom_combined
     
-    def _check_creator_pii(self, text: str) -> bool:
-        """Check text against creator-specific PII."""
-        text_lower = text.lower()
-        
-        # Check each category
-        for name in self._creator_names:
-            if name in text_lower:
-                return True
+    def _check_patterns(self, text: str) -> Optional[str]:
+        """Check text against static PII patterns (single pass).
         
-        for handle in self._creator_handles:
-            if handle in text_lower:
-                return True
-        
-        for location in self._creator_locations:
-            if location in text_lower:
-                return True
-        
-        for employer in self._creator_employers:
-            if employer in text_lower:
-                return True
-        
-        for family in self._creator_family:
-            if family in text_lower:
+        Returns the matched category (the named group) or None.
+        """
+        for match in _COMBINED.finditer(text):
+            if _is_pii_match(match):
+                return match.lastgroup
+        return None
+    
+    def _check_creator_pii(self, text: str, text_digits: str) -> bool:
+        """Check text (and its digit-only form) against creator-specific PII."""
+        # Check every keyword category in a single pass. Only the automaton
+        # needs lowercased text - the regex fallback is case-insensitive.
+        if ahocorasick is not None:
+            automaton = self._keyword_automaton()
+            if automaton is not None:
+                for _ in _keyword_spans(automaton, text.lower()):
+                    return True
+        else:
+            creator_regex = self._keyword_regex()
+            if creator_regex is not None and creator_regex.search(text):
                 return True
         
         # Check phone numbers (normalized)
-        text_nums = re.sub(r'[^\d]', '', text)
         for phone in self._creator_phone:
-            if phone in text_nums:
-                return True
-        
-        for email in self._creator_email:
-            if email in text_lower:
-                return True
-        
-        for address in self._creator_addresses:
-            if address in text_lower:
+            if phone in text_digits:
                 return True
         
         return False
     
     def _check_custom_patterns(self, text: str) -> bool:
         """Check against custom patterns."""
+        if not self._custom_patterns:
+            return False
+        
+        # Zero-width matches (e.g. from "x*") carry no PII
+        custom_regex = self._custom_regex()
+        if custom_regex is not None:
+            return any(match.group() for match in custom_regex.finditer(text))
+        
         for pattern in self._custom_patterns:
-            if pattern.search(text):
+            if any(match.group() for match in pattern.finditer(text)):
                 return True
         return False
     
-    def contains_pii(self, text: str) -> bool:
+    def contains_pii(self, text: str) -> Optional[str]:
         """
         Check if text contains PII.
         
@@ -184,21 +405,53 @@ class PIIDetector:
             text: Text to check
             
         Returns:
-            True if PII is detected, False if safe
+            Category of the PII detected (e.g. "email", "creator",
+            "custom"), or None if safe
         """
+        if not text:
+            return None
+        
+        key = self._verdict_key(text)
+        cache = self._verdict_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        
+        verdict = self._detect(text)
+        self._store_verdict(key, verdict)
+        return verdict
+    
+    @staticmethod
+    def _verdict_key(text: str) -> bytes:
+        """Cache key for text - a digest, so the text itself is never kept."""
+        return hashlib.sha256(text.encode("utf-8", "surrogatepass")).digest()
+    
+    def _store_verdict(self, key: bytes, verdict: Optional[str]) -> None:
+        """Remember a verdict, evicting the least recently used one."""
+        cache = self._verdict_cache
+        cache[key] = verdict
+        if len(cache) > _VERDICT_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _detect(self, text: str) -> Optional[str]:
+        """Run every detection stage on text (uncached)."""
         # Check static patterns first
-        if self._check_patterns(text):
-            return True
+        category = self._check_patterns(text)
+        if category:
+            return category
+        
+        # Digit-only form is only needed for creator phone numbers
+        text_digits = _NON_DIGIT_RE.sub('', text) if self._creator_phone else ''
         
         # Check creator-specific PII
-        if self._check_creator_pii(text):
-            return True
+        if self._check_creator_pii(text, text_digits):
+            return "creator"
         
         # Check custom patterns
         if self._check_custom_patterns(text):
-            return True
+            return "custom"
         
-        return False
+        return None
     
     def check_and_sanitize(self, text: str, placeholder: str = "[REDACTED]") -> tuple:
         """
@@ -209,26 +462,113 @@ class PIIDetector:
             placeholder: What to replace detected PII with
             
         Returns:
-            Tuple of (contains_pii: bool, sanitized_text: str)
+            Tuple of (category: str or None, sanitized_text: str), where
+            category is the first PII category redacted (as in contains_pii)
         """
-        if not self.contains_pii(text):
-            return False, text
+        if not text:
+            return None, text
+        
+        # Known-safe text needs no redaction passes
+        key = self._verdict_key(text)
+        cache = self._verdict_cache
+        if key in cache and cache[key] is None:
+            cache.move_to_end(key)
+            return None, text
         
-        # Sanitize by removing patterns
-        sanitized = text
+        # Detect and redact in the same passes, noting the first category
+        category = None
+        
+        def redact_static(match) -> str:
+            nonlocal category
+            if not _is_pii_match(match):
+                return match.group()
+            category = category or match.lastgroup
+            return placeholder
         
         # Remove static pattern matches
-        for name, pattern in PII_PATTERNS.items():
-            sanitized = pattern.sub(placeholder, sanitized)
+        sanitized = _COMBINED.sub(redact_static, text)
+        
+        # Remove creator-specific PII (case-insensitive, one pass)
+        sanitized, count = self._redact_creator_keywords(sanitized, placeholder)
+        if count:
+            category = category or "creator"
         
-        # Remove creator-specific PII
-        for name in self._creator_names:
-            sanitized = sanitized.replace(name, placeholder)
+        # Remove custom pattern matches
+        sanitized, count = self._redact_custom_patterns(sanitized, placeholder)
+        if count:
+            category = category or "custom"
         
-        for handle in self._creator_handles:
-            sanitized = sanitized.replace(handle, placeholder)
+        # Creator phone numbers are matched on digits only - they can be
+        # detected but not located for redaction
+        if not category and self._creator_phone:
+            text_digits = _NON_DIGIT_RE.sub('', text)
+            if any(phone in text_digits for phone in self._creator_phone):
+                category = "creator"
+        
+        self._store_verdict(key, category)
+        if category:
+            return category, sanitized
+        return None, text
+    
+    def _redact_creator_keywords(self, text: str, placeholder: str) -> Tuple[str, int]:
+        """Replace creator keyword hits; returns (text, replacement count)."""
+        automaton = self._keyword_automaton() if ahocorasick is not None else None
+        if automaton is not None:
+            text_lower = text.lower()
+            # Automaton spans index the lowercased text - only usable as-is
+            # when lowercasing kept every character in place
+            if len(text_lower) == len(text):
+                return self._redact_keywords(text, text_lower, automaton, placeholder)
+        
+        creator_regex = self._keyword_regex()
+        if creator_regex is None:
+            return text, 0
+        return creator_regex.subn(lambda m: placeholder, text)
+    
+    def _redact_custom_patterns(self, text: str, placeholder: str) -> Tuple[str, int]:
+        """Replace custom pattern matches; returns (text, replacement count)."""
+        if not self._custom_patterns:
+            return text, 0
+        
+        total = 0
+        
+        def redact(match) -> str:
+            nonlocal total
+            # Leave zero-width matches (e.g. from "x*") untouched
+            if not match.group():
+                return match.group()
+            total += 1
+            return placeholder
+        
+        custom_regex = self._custom_regex()
+        if custom_regex is not None:
+            return custom_regex.sub(redact, text), total
+        
+        for pattern in self._custom_patterns:
+            text = pattern.sub(redact, text)
+        return text, total
+    
+    @staticmethod
+    def _redact_keywords(
+        text: str, text_lower: str, automaton, placeholder: str
+    ) -> Tuple[str, int]:
+        """Replace every keyword hit in text with placeholder in one pass."""
+        spans = sorted(_keyword_spans(automaton, text_lower))
         
-        return True, sanitized
+        parts = []
+        pos = 0
+        count = 0
+        for start, end in spans:
+            if start < pos:
+                # Overlaps a span already replaced - extend it if needed
+                pos = max(pos, end)
+                continue
+            parts.append(text[pos:start])
+            parts.append(placeholder)
+            pos = end
+            count += 1
+        parts.append(text[pos:])
+        return "".join(parts), count
     
     def clear_all(self) -> None:
         """Clear all PII data from memory."""
@@ -241,6 +581,13 @@ class PIIDetector:
         self._creator_email.clear()
         self._creator_addresses.clear()
         self._custom_patterns.clear()
+        self._custom_combined = None
+        self._custom_dirty = False
+        self._ac = None
+        self._ac_dirty = False
+        self._creator_regex = None
+        self._creator_dirty = False
+        self._verdict_cache.clear()
     
     def get_stats(self) -> dict:
         """Get detection stats (no PII values returned)."""
@@ -308,10 +655,10 @@ if __name__ == "__main__":
     test_texts = [
         "Hello from CREATOR_NAME in LOCATION!",
         "Contact me at seth@example.com",
-        "My phone is 555-123-4567",
+        "My phone is 512-555-0142",
         "This post is about automation",
     ]
     
     for text in test_texts:
-        has_pii = detector.contains_pii(text)
-        print(f"PII Detected: {has_pii} | Text: {text}")
+        category = detector.contains_pii(text)
+        print(f"PII Detected: {category or 'none'} | Text: {text}")